@@ -33,7 +33,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 from hpc_bottleneck_detector.data.manager import DataManager
 from hpc_bottleneck_detector.data.hardware_profiles import HardwareProfileLoader
 from hpc_bottleneck_detector.data_sources import XBATDataSource
-from hpc_bottleneck_detector.strategies.property_node import _aggregate, _get_series
+from hpc_bottleneck_detector.strategies.property_node import _aggregate, _get_values
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s  %(message)s")
 log = logging.getLogger(__name__)
@@ -183,8 +183,8 @@ def _compute_window_values(
         step_size=window_size,
     ):
         try:
-            series = _get_series(metric_cfg, win_dm)
-            value  = _aggregate(series, aggregation)
+            window_values = _get_values(metric_cfg, win_dm)
+            value = _aggregate(window_values, aggregation)
         except (ValueError, ZeroDivisionError, KeyError):
             continue
 
@@ -0,0 +1,157 @@
+"""
+Aggregation Helpers
+
+NaN-aware reductions shared by :class:`~hpc_bottleneck_detector.data.manager.DataManager`
+(batched over every metric row of a window) and the heuristic strategy
+nodes (single derived series).  Both go through :func:`aggregate` so that a
+metric reduced row-wise in a batch yields exactly the same scalar as when it
+is reduced on its own.
+
+When ``numba`` is importable, ``mean`` / ``min`` / ``max`` / ``sum`` are
+served by a compiled kernel that gathers count, sum, min and max in a single
+pass over each row, instead of NumPy's NaN-masking copy followed by one
+reduction pass per statistic.
+"""
+
+from __future__ import annotations
+
+import warnings
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # numba is optional here; fall back to NumPy reductions
+    numba = None
+
+
+#: Aggregation names accepted by :func:`aggregate` (case-insensitive).
+AGGREGATIONS = ("mean", "min", "max", "sum", "total", "median")
+
+_REDUCERS = {
+    "mean":   np.nanmean,
+    "min":    np.nanmin,
+    "max":    np.nanmax,
+    "sum":    np.nansum,
+    "total":  np.nansum,
+    "median": np.nanmedian,
+}
+
+
+# ---------------------------------------------------------------------------
+# Fused single-pass kernel
+# ---------------------------------------------------------------------------
+
+def _nan_stats_rows(values):
+    """
+    Return ``(count, sum, min, max)`` of the non-NaN entries of every row.
+
+    Args:
+        values: C-contiguous float matrix of shape ``(n_rows, n_intervals)``;
+                sums are accumulated in float64 whatever its precision.
+
+    Returns:
+        Float64 array of shape ``(n_rows, 4)``.
+    """
+    n_rows, n_cols = values.shape
+    out = np.empty((n_rows, 4))
+    for i in range(n_rows):
+        count = 0
+        total = 0.0
+        lo = np.inf
+        hi = -np.inf
+        for j in range(n_cols):
+            v = values[i, j]
+            if v == v:  # skip NaN
+                count += 1
+                total += v
+                if v < lo:
+                    lo = v
+                if v > hi:
+                    hi = v
+        out[i, 0] = count
+        out[i, 1] = total
+        out[i, 2] = lo
+        out[i, 3] = hi
+    return out
+
+
+if numba is not None:
+    _nan_stats_rows = numba.njit(cache=True)(_nan_stats_rows)
+
+
+def warm_up() -> None:
+    """
+    Compile the fused kernel ahead of time.
+
+    With ``numba`` the first call of a process pays the JIT (or cache load)
+    cost; batch drivers call this once before their main loop so that cost
+    does not land on the first analysed window.  No-op without ``numba``.
+    """
+    if numba is not None:
+        for dtype in (np.float32, np.float64):
+            _nan_stats_rows(np.zeros((1, 1), dtype=dtype))
+
+
+def _fused_aggregate(values: np.ndarray, agg: str) -> np.ndarray:
+    """Compute *agg* through the compiled single-pass kernel."""
+    n_rows = int(np.prod(values.shape[:-1]))
+    rows = np.ascontiguousarray(values).reshape(n_rows, values.shape[-1])
+    stats = _nan_stats_rows(rows)
+    count, total = stats[:, 0], stats[:, 1]
+
+    if agg in ("sum", "total"):
+        result = total
+    else:
+        empty = count == 0
+        if agg == "mean":
+            result = total / np.where(empty, 1.0, count)
+        elif agg == "min":
+            result = stats[:, 2]
+        else:
+            result = stats[:, 3]
+        result[empty] = np.nan
+
+    return result.reshape(values.shape[:-1])
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def aggregate(values: np.ndarray, aggregation: str) -> np.ndarray:
+    """
+    Reduce *values* along its last axis using the named aggregation.
+
+    NaN entries are ignored.  An all-NaN (or empty) row yields NaN for every
+    aggregation except ``sum``/``total``, which yields ``0.0``.
+
+    Args:
+        values:      1-D series or 2-D ``(n_rows, n_intervals)`` matrix of
+                     float32 or float64 values.
+        aggregation: One of :data:`AGGREGATIONS`.
+
+    Returns:
+        A float64 0-d array for 1-D input, otherwise one value per row.
+
+    Raises:
+        ValueError: If *aggregation* is not supported.
+    """
+    agg = aggregation.lower()
+    reducer = _REDUCERS.get(agg)
+    if reducer is None:
+        raise ValueError(f"Unknown aggregation: '{aggregation}'")
+
+    if numba is not None and reducer is not np.nanmedian:
+        return _fused_aggregate(values, agg)
+
+    # Accumulate in double precision, as the fused kernel does.
+    values = np.asarray(values, dtype=np.float64)
+    if values.shape[-1] == 0:
+        fill = 0.0 if reducer is np.nansum else np.nan
+        return np.full(values.shape[:-1], fill)
+
+    # All-NaN rows legitimately reduce to NaN; silence numpy's warning.
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return reducer(values, axis=-1)
@@ -6,7 +6,7 @@ Holds static metadata about an HPC job and the hardware nodes it ran on.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
 # Keys extracted from the node hardware response that are relevant for
@@ -107,6 +107,17 @@ class JobContext:
         self.node_hardware = node_hardware
         self.supplemental_benchmarks: Dict[str, float] = supplemental_benchmarks or {}
 
+        # node_hardware is static for the lifetime of a job, so the values
+        # derived from it are computed once.  Supplemental benchmarks are
+        # injected after construction and therefore never cached.
+        self._bench_cache: Dict[Tuple[str, str], Optional[float]] = {}
+        self._first_cpu: Optional[Dict[str, Any]] = next(
+            (info["cpu"] for info in node_hardware.values() if "cpu" in info), None
+        )
+        self._first_memory: Optional[Dict[str, Any]] = next(
+            (info["memory"] for info in node_hardware.values() if "memory" in info), None
+        )
+
     # ------------------------------------------------------------------
     # Accessors
     # ------------------------------------------------------------------
@@ -141,23 +152,35 @@ class JobContext:
         Returns:
             Float value, or ``None`` if the key is absent from all sources.
         """
-        values = [
-            info["benchmarks"][key]
-            for info in self.node_hardware.values()
-            if "benchmarks" in info and key in info["benchmarks"]
-        ]
-        if values:
-            if aggregate == "min":
-                return min(values)
-            if aggregate == "max":
-                return max(values)
-            return sum(values) / len(values)
+        cache_key = (key, aggregate)
+        if cache_key in self._bench_cache:
+            value = self._bench_cache[cache_key]
+        else:
+            value = self._aggregate_node_benchmark(key, aggregate)
+            self._bench_cache[cache_key] = value
+        if value is not None:
+            return value
 
         if key in self.supplemental_benchmarks:
             return float(self.supplemental_benchmarks[key])
 
         return None
 
+    def _aggregate_node_benchmark(self, key: str, aggregate: str) -> Optional[float]:
+        """Aggregate an API-provided benchmark across nodes (``None`` if absent)."""
+        values = [
+            info["benchmarks"][key]
+            for info in self.node_hardware.values()
+            if "benchmarks" in info and key in info["benchmarks"]
+        ]
+        if not values:
+            return None
+        if aggregate == "min":
+            return min(values)
+        if aggregate == "max":
+            return max(values)
+        return sum(values) / len(values)
+
     def get_cpu_info(self, key: str) -> Optional[Any]:
         """
         Return a CPU property from the first node.
@@ -166,17 +189,15 @@ class JobContext:
         first entry is representative.  Use ``node_hardware`` directly for
         heterogeneous jobs.
         """
-        for info in self.node_hardware.values():
-            if "cpu" in info:
-                return info["cpu"].get(key)
-        return None
+        if self._first_cpu is None:
+            return None
+        return self._first_cpu.get(key)
 
     def get_memory_info(self, key: str) -> Optional[Any]:
         """Return a memory property from the first node (representative)."""
-        for info in self.node_hardware.values():
-            if "memory" in info:
-                return info["memory"].get(key)
-        return None
+        if self._first_memory is None:
+            return None
+        return self._first_memory.get(key)
 
     # ------------------------------------------------------------------
     # Helpers
@@ -221,6 +242,16 @@ class JobContext:
             or configuration.get("variantName")
         )
 
+        # Single pass over the nodes: hostname -> hash map plus the filtered
+        # hardware info of every distinct hash.
+        nodes_map: Dict[str, Optional[str]] = {}
+        node_hardware: Dict[str, Dict[str, Any]] = {}
+        for hostname, meta in nodes_raw.items():
+            h = meta.get("hash")
+            nodes_map[hostname] = h
+            if h and h not in node_hardware and h in node_hardware_raw:
+                node_hardware[h] = _extract_node_info(node_hardware_raw[h])
+
         job_metadata = {
             "runtime": job_entry.get("runtime"),
             "capturetime": job_entry.get("capturetime"),
@@ -230,16 +261,7 @@ class JobContext:
             "variantName": variant,
             "sampling_interval_seconds": interval_seconds,
             # Map hostname -> hash for reference
-            "nodes": {
-                hostname: meta.get("hash")
-                for hostname, meta in nodes_raw.items()
-            },
-        }
-
-        node_hardware = {
-            hash_: _extract_node_info(node_hardware_raw[hash_])
-            for _, hash_ in job_metadata["nodes"].items()
-            if hash_ and hash_ in node_hardware_raw
+            "nodes": nodes_map,
         }
 
         return cls(
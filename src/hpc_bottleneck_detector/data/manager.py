@@ -9,8 +9,9 @@ import logging
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Generator, List, Optional, Tuple, Union
+from typing import Callable, Dict, Generator, List, Optional, Tuple, Union
 
+from .aggregation import aggregate
 from .job_context import JobContext
 
 logger = logging.getLogger(__name__)
@@ -31,20 +32,42 @@ METRIC_BENCHMARK_MAP: dict[str, str] = {
     "memory_UPI Bandwidth_total":    "bandwidth_upi",
 }
 
+# Element type of the cached value matrix.  Full precision by default so that
+# lookups, aggregates and threshold checks see exactly the values in
+# ``job_data``.  Pass ``value_dtype=np.float32`` to halve the footprint of the
+# matrix when values a few ULPs off are acceptable (e.g. thresholds may then
+# flip for values sitting exactly on them); reductions still accumulate in
+# float64.
+DEFAULT_VALUE_DTYPE = np.float64
+
+# Identifier columns keying the metric lookup index.
+_KEY_COLUMNS = ("group", "metric", "trace")
+
 
 class DataManager:
     """
     DataManager for accessing job metrics.
 
+    The wrapped ``job_data`` is treated as read-only: metric lookups go
+    through an index built once at construction time, so mutating the
+    DataFrame afterwards is not reflected by the accessors.
+
     Attributes:
         job_data:    DataFrame containing all job metrics (time-series rows).
         job_id:      The job identifier extracted from the data.
         job_context: Optional :class:`JobContext` carrying static hardware
                      metadata (benchmarks, CPU/memory specs, job runtime ...).
-                     ``None`` when the data source cannot provide it.
+                     ``None`` when the data source cannot provide it.  Built
+                     on first access when a ``job_context_factory`` is given.
     """
 
-    def __init__(self, job_data: pd.DataFrame, job_context: Optional[JobContext] = None):
+    def __init__(
+        self,
+        job_data: pd.DataFrame,
+        job_context: Optional[JobContext] = None,
+        value_dtype: np.dtype = DEFAULT_VALUE_DTYPE,
+        job_context_factory: Optional[Callable[[], Optional[JobContext]]] = None,
+    ):
         """
         Initialize the DataManager with job data.
 
@@ -52,19 +75,165 @@ class DataManager:
             job_data:    DataFrame with columns: jobId, group, metric, trace,
                          interval 0, interval 1, ...
             job_context: Optional static job / hardware context.
+            value_dtype: Floating-point type of the cached value matrix
+                         returned by :meth:`get_metric_array` and friends
+                         (default :data:`DEFAULT_VALUE_DTYPE`).
+            job_context_factory: Callable building the job context, invoked
+                         on the first access of :attr:`job_context` instead
+                         of up front.  Ignored when *job_context* is given.
         """
-        self.job_data = job_data
-        self.job_context = job_context
-
-        # Extract job ID from the data
+        # Split the columns once into interval and identifier columns.
+        columns = job_data.columns.to_numpy()
+        is_interval = np.char.startswith(columns.astype(str), 'interval ')
+        interval_cols: List[str] = list(columns[is_interval])
+
+        # Lookup structures: (group, metric, trace) -> positional row index.
+        # The first matching row wins, mirroring the previous mask-based
+        # lookup; (group, metric) resolves requests that omit the trace.
+        index: Dict[Tuple[str, str, Optional[str]], int] = {}
+        index_no_trace: Dict[Tuple[str, str], int] = {}
         if not job_data.empty:
-            self.job_id = str(job_data['jobId'].iloc[0])
-        else:
-            self.job_id = None
+            # A job repeats a handful of distinct identifiers across many
+            # rows: find each key's first row on categorical codes, so only
+            # those rows are visited in Python.  The codes stay local;
+            # job_data keeps its own dtypes.
+            codes = pd.DataFrame({
+                col: pd.Categorical(job_data[col]).codes for col in _KEY_COLUMNS
+            })
+            group, metric, trace = (job_data[col].to_numpy() for col in _KEY_COLUMNS)
+            for i in np.flatnonzero(~codes.duplicated().to_numpy()).tolist():
+                index[(group[i], metric[i], trace[i])] = i
+            first_no_trace = ~codes[['group', 'metric']].duplicated().to_numpy()
+            for i in np.flatnonzero(first_no_trace).tolist():
+                index_no_trace[(group[i], metric[i])] = i
+
+        self._init_state(
+            job_data=job_data,
+            job_id=str(job_data['jobId'].iloc[0]) if not job_data.empty else None,
+            job_context=job_context,
+            job_context_factory=job_context_factory if job_context is None else None,
+            frame=job_data,
+            frame_interval_cols=interval_cols,
+            interval_cols=interval_cols,
+            id_cols=list(columns[~is_interval]),
+            index=index,
+            index_no_trace=index_no_trace,
+            # All interval values as one C-contiguous (n_metrics, n_intervals)
+            # matrix of *value_dtype*.
+            values=np.ascontiguousarray(job_data[interval_cols].to_numpy(dtype=value_dtype)),
+            available_metrics=None,
+        )
+
+    def _init_state(
+        self,
+        *,
+        job_data: Optional[pd.DataFrame],
+        job_id: Optional[str],
+        job_context: Optional[JobContext],
+        job_context_factory: Optional[Callable[[], Optional[JobContext]]],
+        frame: pd.DataFrame,
+        frame_interval_cols: List[str],
+        interval_cols: List[str],
+        id_cols: List[str],
+        index: Dict[Tuple[str, str, Optional[str]], int],
+        index_no_trace: Dict[Tuple[str, str], int],
+        values: np.ndarray,
+        available_metrics: Optional[pd.DataFrame],
+    ) -> None:
+        """
+        Set every attribute of a DataManager.
+
+        Both :meth:`__init__` and :meth:`_window_of` (which bypasses
+        ``__init__``) go through here, so full managers and windows always
+        carry the same attributes; per-instance caches start out empty.
+        """
+        self._job_data: Optional[pd.DataFrame] = job_data
+        self.job_id = job_id
+        self._job_context: Optional[JobContext] = job_context
+        self._job_context_factory = job_context_factory
+
+        # Frame the rows and identifiers are read from, and the names of its
+        # interval columns backing this manager.  Windows created by
+        # slice_window share their parent's frame; their own interval
+        # columns are renumbered from ``interval 0``.
+        self._frame: pd.DataFrame = frame
+        self._frame_interval_cols: List[str] = frame_interval_cols
+        self._interval_cols: List[str] = interval_cols
+        self._id_cols: List[str] = id_cols
+        self._n_intervals: int = len(interval_cols)
+
+        self._index = index
+        self._index_no_trace = index_no_trace
+        # Rows handed out by get_metric_array are read-only views into it.
+        self._values: np.ndarray = values
+        self._values.flags.writeable = False
+        self._available_metrics: Optional[pd.DataFrame] = available_metrics
+
+        self._row_aggregates: Dict[str, np.ndarray] = {}
+        self._interval_index: Optional[pd.Index] = None
+
+    @classmethod
+    def _window_of(cls, parent: "DataManager", start: int, end: int) -> "DataManager":
+        """
+        Build the DataManager for intervals [start, end) of *parent*.
+
+        Only the value matrix is sliced; the row index, identifiers and
+        frame are shared with *parent*, and the renumbered ``job_data``
+        DataFrame is materialised on first access.
+        """
+        frame_interval_cols = parent._frame_interval_cols[start:end]
+        window = cls.__new__(cls)
+        window._init_state(
+            job_data=None,
+            job_id=parent.job_id,
+            job_context=parent._job_context,
+            # Resolve through the parent so the context is built only once.
+            job_context_factory=(
+                (lambda: parent.job_context)
+                if parent._job_context_factory is not None
+                else None
+            ),
+            frame=parent._frame,
+            frame_interval_cols=frame_interval_cols,
+            interval_cols=[f"interval {i}" for i in range(len(frame_interval_cols))],
+            id_cols=parent._id_cols,
+            index=parent._index,
+            index_no_trace=parent._index_no_trace,
+            values=np.ascontiguousarray(parent._values[:, start:end]),
+            available_metrics=parent._available_metrics,
+        )
+        return window
+
+    @property
+    def job_data(self) -> pd.DataFrame:
+        """DataFrame containing all job metrics (time-series rows)."""
+        if self._job_data is None:
+            # Window: copy the parent's columns, renumbering the intervals
+            # as interval 0, interval 1, ...
+            sliced = self._frame[self._id_cols + self._frame_interval_cols].copy()
+            sliced.columns = self._id_cols + self._interval_cols
+            self._job_data = sliced
+        return self._job_data
+
+    @property
+    def job_context(self) -> Optional[JobContext]:
+        """Static job / hardware context, or ``None`` when unavailable."""
+        if self._job_context_factory is not None:
+            self._job_context = self._job_context_factory()
+            self._job_context_factory = None
+        return self._job_context
+
+    @job_context.setter
+    def job_context(self, job_context: Optional[JobContext]) -> None:
+        self._job_context = job_context
+        self._job_context_factory = None
     
     def get_metric(self, group: str, metric: str, trace: Optional[str] = None) -> pd.Series:
         """
         Get time series data for a specific metric.
+
+        This is a thin pandas wrapper around :meth:`get_metric_array`; numeric
+        consumers should call that directly.
         
         Args:
             group: Metric group (e.g., 'cpu', 'memory')
@@ -77,23 +246,75 @@ class DataManager:
         Raises:
             ValueError: If the metric is not found
         """
-        # Build filter conditions
-        condition = (self.job_data['group'] == group) & (self.job_data['metric'] == metric)
-        
-        if trace is not None:
-            condition = condition & (self.job_data['trace'] == trace)
-        
-        # Filter the data
-        metric_data = self.job_data[condition]
-        
-        if metric_data.empty:
+        i = self._require_row(group, metric, trace)
+        if self._interval_index is None:
+            # Built on first use and shared by every returned Series.
+            self._interval_index = pd.Index(self._interval_cols)
+        return pd.Series(
+            self._values[i],
+            index=self._interval_index,
+            name=self._frame.index[i],
+        )
+
+    def get_metric_array(self, group: str, metric: str, trace: Optional[str] = None) -> np.ndarray:
+        """
+        Get the raw interval values of a metric as an array of the
+        DataManager's ``value_dtype``.
+
+        Unlike :meth:`get_metric` no pandas object is built: the result is a
+        read-only view into the cached value matrix, so it is cheap enough to
+        call from per-window detector code.
+
+        Raises:
+            ValueError: If the metric is not found
+        """
+        return self._values[self._require_row(group, metric, trace)]
+
+    def get_metric_aggregate(
+        self,
+        group: str,
+        metric: str,
+        trace: Optional[str] = None,
+        aggregation: str = "mean",
+    ) -> float:
+        """
+        Get a metric's time series reduced to a scalar (NaN values ignored).
+
+        The first request for a given *aggregation* reduces every metric row
+        in a single vectorised pass and caches the result, so strategy trees
+        that test the same metrics (e.g. shared family gates) within a window
+        only pay for one reduction.
+
+        Args:
+            group:       Metric group (e.g., 'cpu', 'memory')
+            metric:      Metric name (e.g., 'Branching')
+            trace:       Trace name (optional)
+            aggregation: One of ``mean``, ``min``, ``max``, ``sum``/``total``,
+                         ``median``.
+
+        Raises:
+            ValueError: If the metric is not found or the aggregation is unknown
+        """
+        i = self._require_row(group, metric, trace)
+        agg = aggregation.lower()
+        reduced = self._row_aggregates.get(agg)
+        if reduced is None:
+            reduced = aggregate(self._values, agg)
+            self._row_aggregates[agg] = reduced
+        return float(reduced[i])
+
+    def _require_row(self, group: str, metric: str, trace: Optional[str]) -> int:
+        """Like :meth:`_row_position` but raise ``ValueError`` when absent."""
+        i = self._row_position(group, metric, trace)
+        if i is None:
             raise ValueError(f"Metric not found: group='{group}', metric='{metric}', trace='{trace}'")
-        
-        # Extract interval columns
-        interval_cols = [col for col in self.job_data.columns if col.startswith('interval ')]
-        
-        # Return the first matching row (should be only one)
-        return metric_data[interval_cols].iloc[0]
+        return i
+
+    def _row_position(self, group: str, metric: str, trace: Optional[str]) -> Optional[int]:
+        """Return the positional row index of a metric, or ``None`` if absent."""
+        if trace is None:
+            return self._index_no_trace.get((group, metric))
+        return self._index.get((group, metric, trace))
     
     def get_metrics(self, metric_specs: List[Dict[str, str]]) -> pd.DataFrame:
         """
@@ -106,27 +327,34 @@ class DataManager:
         Returns:
             DataFrame where each row is a metric time series, indexed by descriptive names
         """
-        result = {}
+        rows: Dict[str, int] = {}
         
         for spec in metric_specs:
             group = spec['group']
             metric = spec['metric']
             trace = spec.get('trace')
             
-            try:
-                series = self.get_metric(group, metric, trace)
-                
-                # Create a descriptive key
-                key = f"{group}_{metric}"
-                if trace:
-                    key += f"_{trace.replace(' ', '_')}"
-                
-                result[key] = series
-            except ValueError:
+            i = self._row_position(group, metric, trace)
+            if i is None:
                 # Skip metrics that are not found
                 continue
+            
+            # Create a descriptive key
+            key = f"{group}_{metric}"
+            if trace:
+                key += f"_{trace.replace(' ', '_')}"
+            
+            rows[key] = i
+        
+        if not rows:
+            return pd.DataFrame()
         
-        return pd.DataFrame(result).T
+        # One gather from the cached matrix instead of one Series per metric
+        return pd.DataFrame(
+            self._values[list(rows.values())],
+            index=list(rows),
+            columns=self._interval_cols,
+        )
     
     def list_available_metrics(self) -> pd.DataFrame:
         """
@@ -135,15 +363,17 @@ class DataManager:
         Returns:
             DataFrame with columns: group, metric, trace
         """
-        return self.job_data[['group', 'metric', 'trace']].drop_duplicates().reset_index(drop=True)
+        if self._available_metrics is None:
+            self._available_metrics = (
+                self._frame[['group', 'metric', 'trace']]
+                .drop_duplicates()
+                .reset_index(drop=True)
+            )
+        return self._available_metrics.copy()
 
     def has_metric(self, group: str, metric: str, trace: Optional[str] = None) -> bool:
         """Return True when the requested metric exists in the job data."""
-        try:
-            self.get_metric(group, metric, trace)
-            return True
-        except ValueError:
-            return False
+        return self._row_position(group, metric, trace) is not None
     
     def get_time_series_length(self) -> int:
         """
@@ -152,8 +382,7 @@ class DataManager:
         Returns:
             Number of time intervals
         """
-        interval_cols = [col for col in self.job_data.columns if col.startswith('interval ')]
-        return len(interval_cols)
+        return self._n_intervals
 
     @property
     def sampling_interval(self) -> Optional[int]:
@@ -189,12 +418,35 @@ class DataManager:
         """
         Get all metrics as a DataFrame with one row per metric.
         
+        The wrapped DataFrame is returned as-is (no copy); callers must not
+        modify it.  Use :meth:`get_all_time_series_array` when only the
+        numeric values are needed.
+
         Returns:
             DataFrame where each row is a metric, with columns:
                 - group, metric, trace (identifiers)
                 - interval 0, interval 1, ... (time series values)
         """
-        return self.job_data.copy()
+        return self.job_data
+
+    def get_all_time_series_array(self) -> np.ndarray:
+        """
+        Get all interval values as a read-only ``(n_metrics, n_intervals)``
+        array of the DataManager's ``value_dtype``.
+
+        Row ``i`` corresponds to row ``i`` of :meth:`get_metric_index`.
+        """
+        return self._values
+
+    def get_metric_index(self) -> pd.DataFrame:
+        """
+        Get the identifiers of every metric row, aligned with
+        :meth:`get_all_time_series_array`.
+
+        Returns:
+            DataFrame with columns: group, metric, trace
+        """
+        return self._frame[['group', 'metric', 'trace']].reset_index(drop=True)
 
     def get_flat_dataframe(self, interval_seconds: Optional[int] = None) -> pd.DataFrame:
         """
@@ -243,70 +495,73 @@ class DataManager:
                     "with runtime information is available."
                 )
 
-        interval_cols = self._interval_columns()
-        n_intervals = len(interval_cols)
+        n_intervals = self._n_intervals
 
         cols: dict = {
             "id":   [self.job_id] * n_intervals,
             "time": [i * interval_seconds for i in range(n_intervals)],
         }
 
-        for _, row in self.job_data.iterrows():
-            group = row["group"]
-            metric = row["metric"]
-            trace = row.get("trace")
+        # Model inputs are always built at full precision.
+        matrix = self._values
+        if matrix.dtype != np.float64:
+            matrix = self._frame[self._frame_interval_cols].to_numpy(dtype=np.float64)
 
+        id_rows = self._frame.reindex(columns=["group", "metric", "trace"])
+        col_names: List[str] = []
+        for group, metric, trace in id_rows.itertuples(index=False, name=None):
             col_name = f"{group}_{metric}"
             if pd.notna(trace) and str(trace).strip():
                 col_name += f"_{str(trace).replace(' ', '_')}"
+            col_names.append(col_name)
 
-            cols[col_name] = row[interval_cols].values
-
-        df = pd.DataFrame(cols)
-
-        if self.job_context is not None:
-            df = self._apply_benchmark_normalization(df)
+        scales = (
+            self._benchmark_scales(col_names)
+            if self.job_context is not None
+            else {}
+        )
+        for col_name, values in zip(col_names, matrix):
+            inv_peak = scales.get(col_name)
+            cols[col_name] = values if inv_peak is None else values * inv_peak
 
-        return df
+        return pd.DataFrame(cols)
 
-    def _apply_benchmark_normalization(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _benchmark_scales(self, col_names: List[str]) -> Dict[str, float]:
         """
-        Divide metric columns by their hardware peak from ``job_context``.
+        Return ``{column: 1 / peak}`` for the columns normalised by their
+        hardware peak from ``job_context``.
 
-        Only columns listed in :data:`METRIC_BENCHMARK_MAP` are touched.
-        If the benchmark value is absent or zero, the column is left unchanged.
+        Only columns listed in :data:`METRIC_BENCHMARK_MAP` are considered.
+        If the benchmark value is absent or zero, the column is left out and
+        stays unnormalised.  Returning the reciprocal lets the caller scale
+        each column with one multiply per element instead of a divide.
         """
-        df = df.copy()
-        normalized: list[str] = []
+        present = set(col_names)
+        scales: Dict[str, float] = {}
         skipped: list[str] = []
 
         for col, benchmark_key in METRIC_BENCHMARK_MAP.items():
-            if col not in df.columns:
+            if col not in present:
                 continue
             peak = self.job_context.get_benchmark(benchmark_key)
             if peak and peak > 0:
-                df[col] = df[col] / peak
-                normalized.append(col)
+                scales[col] = 1.0 / peak
             else:
                 skipped.append(col)
 
-        if normalized:
-            logger.debug("Normalized by benchmark peak: %s", normalized)
+        if scales:
+            logger.debug("Normalized by benchmark peak: %s", list(scales))
         if skipped:
             logger.debug(
                 "Benchmark peak unavailable for (left raw): %s", skipped
             )
 
-        return df
+        return scales
 
     # ------------------------------------------------------------------
     # Windowing helpers
     # ------------------------------------------------------------------
 
-    def _interval_columns(self) -> List[str]:
-        """Return the ordered list of interval column names."""
-        return [col for col in self.job_data.columns if col.startswith("interval ")]
-
     def slice_window(self, start: int, end: int) -> "DataManager":
         """
         Return a new DataManager containing only intervals [start, end).
@@ -322,19 +577,7 @@ class DataManager:
         Returns:
             A new :class:`DataManager` scoped to the requested interval slice.
         """
-        all_interval_cols = self._interval_columns()
-        slice_cols = all_interval_cols[start:end]
-
-        id_cols = [c for c in self.job_data.columns if not c.startswith("interval ")]
-        sliced = self.job_data[id_cols + slice_cols].copy()
-
-        # Renumber interval columns: interval 0, interval 1, ...
-        rename_map = {
-            old: f"interval {i}" for i, old in enumerate(slice_cols)
-        }
-        sliced.rename(columns=rename_map, inplace=True)
-
-        return DataManager(sliced, job_context=self.job_context)
+        return DataManager._window_of(self, start, end)
 
     def iterate_windows(
         self,
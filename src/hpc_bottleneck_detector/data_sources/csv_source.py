@@ -5,11 +5,12 @@ This module provides a CSV-based data source for reading HPC job metrics
 from CSV files (e.g., exported from XBAT).
 """
 
-import csv
-import io
+import logging
+import os
 import re
+from glob import escape as glob_escape
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -17,6 +18,220 @@ import pandas as pd
 from .interface import IDataSource
 from ..data.manager import DataManager
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    from pyarrow import csv as pa_csv
+except ImportError:  # pyarrow is optional; the pure-Python parser is used instead
+    pa = None
+    pc = None
+    pa_csv = None
+
+logger = logging.getLogger(__name__)
+
+
+# Identifier columns are always read as text so that e.g. job IDs with
+# leading zeros survive and empty traces stay empty strings.
+_ID_COLUMNS = ("jobId", "group", "metric", "trace")
+
+
+def _with_default_index(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Give a freshly filtered *df* a 0..n-1 RangeIndex in place.
+
+    Unlike ``reset_index(drop=True)`` this does not copy the data again;
+    *df* must not be a view shared with another frame.
+    """
+    df.index = pd.RangeIndex(len(df))
+    return df
+
+
+def _drop_repeated_headers(df: pd.DataFrame) -> pd.DataFrame:
+    """Drop header rows repeated inside concatenated exports, if there are any."""
+    is_header = (df["jobId"] == "jobId").to_numpy()
+    if not is_header.any():
+        return df
+    return _with_default_index(df[~is_header])
+
+
+def _to_interval_values(values: pd.Series) -> pd.Series:
+    """
+    Coerce a parsed interval column that is not numeric to float.
+
+    Goes through the text form so that values a parser took for booleans
+    (``true``/``false``) become NaN like any other non-numeric text,
+    rather than 1.0/0.0.
+    """
+    return pd.to_numeric(values.astype(str), errors="coerce")
+
+
+def _read_header_line(stream) -> bytes:
+    """Return the first line of the binary *stream* and rewind it."""
+    chunks = []
+    while True:
+        chunk = stream.read(1 << 16)
+        if not chunk:
+            break
+        end = chunk.find(b"\n")
+        if end >= 0:
+            chunks.append(chunk[:end])
+            break
+        chunks.append(chunk)
+    stream.seek(0)
+    return b"".join(chunks)
+
+
+def read_csv_ragged(source, delimiter: str = ",") -> pd.DataFrame:
+    """
+    Parse an XBAT CSV export whose rows may have too many or too few fields.
+
+    Every row is cut or padded to the header width: trailing overflow values
+    are dropped and missing ones become NaN.  Blank lines and repeated header
+    rows are skipped.  Shared by :class:`CSVDataSource` and
+    :class:`~hpc_bottleneck_detector.data_sources.xbat_source.XBATDataSource`.
+
+    Args:
+        source:    File path or readable file object.
+        delimiter: Field delimiter.
+
+    Returns:
+        The parsed DataFrame; empty when the input holds only a header.
+
+    Raises:
+        pandas.errors.EmptyDataError: If the input has no header line.
+    """
+    header = pd.read_csv(source, sep=delimiter, nrows=0).columns
+    if hasattr(source, "seek"):
+        source.seek(0)
+    interval_cols = [col for col in header if col.startswith("interval ")]
+
+    # Selecting the columns by callable makes pandas' C tokenizer truncate
+    # overlong rows instead of rejecting them, and short rows are padded;
+    # index_col=False stops it from turning surplus leading fields of an
+    # overlong first row into an index.
+    # Identifiers stay verbatim text; interval values are parsed as floats
+    # directly, only empty fields counting as missing.
+    df = pd.read_csv(
+        source,
+        sep=delimiter,
+        dtype={col: str for col in header if col not in interval_cols},
+        keep_default_na=False,
+        na_values={col: [""] for col in interval_cols},
+        usecols=lambda _: True,
+        index_col=False,
+        float_precision="round_trip",
+    )
+    if "jobId" in df.columns:
+        df = _drop_repeated_headers(df)
+
+    # Columns holding any non-numeric text (e.g. repeated header rows or
+    # true/false) were read as strings or booleans; coerce those the same
+    # way as the other parsers.
+    for column in interval_cols:
+        if df[column].dtype.kind not in "iuf":
+            df[column] = _to_interval_values(df[column])
+
+    return df
+
+
+def read_csv_arrow(
+    source,
+    delimiter: str = ",",
+    job_id: Optional[str] = None,
+) -> Optional[pd.DataFrame]:
+    """
+    Parse an XBAT CSV export with PyArrow's multi-threaded columnar reader.
+
+    Shared by :class:`CSVDataSource` and
+    :class:`~hpc_bottleneck_detector.data_sources.xbat_source.XBATDataSource`.
+
+    Args:
+        source:    File path (memory-mapped for the read), readable binary
+                   file object, or :class:`pyarrow.Buffer` holding the CSV
+                   bytes.
+        delimiter: Field delimiter.
+        job_id:    When given, the input is read batch by batch and only the
+                   rows of this job are kept, so the rows of other jobs are
+                   never converted to pandas.
+
+    Returns:
+        The parsed DataFrame, or ``None`` when PyArrow is unavailable, the
+        data is not a rectangular CSV (e.g. ragged rows), or it contains no
+        data rows, so the caller can fall back to its robust parser.  With
+        *job_id* an empty DataFrame means the job is not in the input.
+    """
+    if pa_csv is None:
+        return None
+
+    if isinstance(source, pa.Buffer):
+        stream = pa.BufferReader(source)
+    elif isinstance(source, (str, Path)):
+        # Memory-map files: the reader threads then pull their blocks straight
+        # from the page cache instead of through buffered read() calls.
+        try:
+            stream = pa.memory_map(str(source), "r")
+        except OSError:
+            return None
+    else:
+        stream = source
+
+    try:
+        # Interval columns are pinned to float64 rather than inferred, which
+        # would e.g. turn a column of true/false text into booleans (1.0/0.0
+        # once numeric) where the robust parsers yield NaN; such text now
+        # fails the read instead.  Their header names count as nulls so that
+        # repeated header rows still parse.  Pinning also keeps the streaming
+        # reader below from inferring types from its first block only.
+        header = _read_header_line(stream).decode("utf-8-sig").rstrip("\r")
+        interval_cols = [col for col in header.split(delimiter) if col.startswith("interval ")]
+        options = dict(
+            read_options=pa_csv.ReadOptions(use_threads=True, block_size=8 << 20),
+            parse_options=pa_csv.ParseOptions(delimiter=delimiter),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={
+                    **{col: pa.string() for col in _ID_COLUMNS},
+                    **{col: pa.float64() for col in interval_cols},
+                },
+                strings_can_be_null=False,
+                null_values=pa_csv.ConvertOptions().null_values + interval_cols,
+            ),
+        )
+        if job_id is None:
+            table = pa_csv.read_csv(stream, **options)
+        else:
+            # Filter every batch in Arrow before anything reaches pandas.
+            reader = pa_csv.open_csv(stream, **options)
+            table = pa.Table.from_batches(
+                [batch.filter(pc.equal(batch.column("jobId"), job_id)) for batch in reader],
+                schema=reader.schema,
+            )
+    except (pa.ArrowInvalid, OSError, KeyError, UnicodeDecodeError) as exc:
+        logger.debug("PyArrow could not read the CSV input: %s", exc)
+        return None
+    finally:
+        if stream is not source:
+            stream.close()
+
+    # One block per column so the per-column numeric coercion below does
+    # not consolidate; the Arrow buffers are released while converting.
+    df = table.to_pandas(split_blocks=True, self_destruct=True)
+    del table
+    if "jobId" in df.columns:
+        # Repeated header rows (concatenated exports) are dropped, as in
+        # the robust parsers.
+        df = _drop_repeated_headers(df)
+
+    if df.empty and job_id is None:
+        return None
+
+    # Only columns the header line did not name as intervals (e.g. quoted
+    # names) were inferred; coerce those the same way as the other parsers.
+    for column in df.columns:
+        if column.startswith("interval ") and df[column].dtype != np.float64:
+            df[column] = _to_interval_values(df[column])
+
+    return df
+
 
 class CSVDataSource(IDataSource):
     """
@@ -34,24 +249,50 @@ class CSVDataSource(IDataSource):
         to obtain a :class:`~hpc_bottleneck_detector.data.job_context.JobContext`
         populated with hardware benchmarks and node specs.
 
+    The parsed file is cached on the instance, split by job ID, so fetching
+    several jobs from the same file parses it only once.  The cache is
+    invalidated when the file's modification time changes.  With
+    ``cache_jobs=False`` each fetch instead keeps only the requested job's
+    rows while reading (when PyArrow is installed), which bounds peak memory
+    for one-off lookups in large multi-job exports.  With
+    ``cache_parsed`` the parse is also mirrored to a Feather file next to
+    the CSV (``<name>.<mtime_ns>.feather``) so later processes skip CSV
+    parsing altogether.
+
     Attributes:
-        file_path: Path to the CSV file
-        delimiter: Delimiter used in the CSV file (default: ',')
+        file_path:    Path to the CSV file
+        delimiter:    Delimiter used in the CSV file (default: ',')
+        cache_parsed: Whether the on-disk Feather mirror is used.
+        cache_jobs:   Whether the parsed file is kept in memory across fetches.
     """
     
-    def __init__(self, file_path: str, delimiter: str = ','):
+    def __init__(
+        self,
+        file_path: str,
+        delimiter: str = ',',
+        cache_parsed: bool = False,
+        cache_jobs: bool = True,
+    ):
         """
         Initialize the CSV data source.
         
         Args:
-            file_path: Path to the CSV file containing job metrics
-            delimiter: CSV delimiter (default: ',')
+            file_path:    Path to the CSV file containing job metrics
+            delimiter:    CSV delimiter (default: ',')
+            cache_parsed: Read / write a Feather mirror of the parsed file
+                          next to it (requires ``pyarrow``; ignored without).
+            cache_jobs:   Keep the parsed file in memory across fetches;
+                          ``False`` reads only the requested job each time.
             
         Raises:
             FileNotFoundError: If the CSV file doesn't exist
         """
         self.file_path = Path(file_path)
         self.delimiter = delimiter
+        self.cache_parsed = cache_parsed
+        self.cache_jobs = cache_jobs
+        # ((path, mtime_ns, delimiter), {job_id: rows}) of the last parse.
+        self._jobs_cache: Optional[Tuple[tuple, Dict[str, pd.DataFrame]]] = None
         
         if not self.file_path.exists():
             raise FileNotFoundError(f"CSV file not found: {file_path}")
@@ -63,41 +304,114 @@ class CSVDataSource(IDataSource):
         Current production behavior can produce csv where a subset of metric
         rows contains one additional trailing interval value. Drop conservatively
         the trailing overflow values so every metric shares the same interval count.
+
+        Well-formed files are parsed with the multi-threaded PyArrow reader
+        when it is installed; files it rejects (e.g. ragged rows) fall back
+        to :func:`read_csv_ragged`.
         """
-        raw_text = self.file_path.read_text()
-        rows = list(csv.reader(io.StringIO(raw_text), delimiter=self.delimiter))
+        df = read_csv_arrow(self.file_path, self.delimiter)
+        if df is not None:
+            return df
 
-        if not rows:
+        try:
+            df = read_csv_ragged(self.file_path, self.delimiter)
+        except pd.errors.EmptyDataError:
             raise IOError(f"CSV file is empty: {self.file_path}")
 
-        header = rows[0]
-        expected_cols = len(header)
-        parsed_rows: list[list[str]] = []
+        if df.empty:
+            raise IOError(f"No data rows found in CSV file: {self.file_path}")
+        return df
 
-        for row in rows[1:]:
-            if not row:
-                continue
+    def prepare_batch(self, job_ids: List[str]) -> None:
+        """
+        Parse the file into the job cache up front when caching is enabled.
 
-            if row[0] == "jobId":
-                continue
+        Failures are left for the individual fetches to report.
+        """
+        if not (self.cache_jobs or self.cache_parsed):
+            return
+        try:
+            self._jobs_by_id()
+        except Exception as exc:
+            logger.debug("Could not preload '%s': %s", self.file_path, exc)
 
-            if len(row) > expected_cols:
-                row = row[:expected_cols]
-            elif len(row) < expected_cols:
-                row = row + [""] * (expected_cols - len(row))
+    def _job_rows(self, job_id: str) -> Optional[pd.DataFrame]:
+        """Return the rows of *job_id*, or ``None`` if the job is absent."""
+        if self.cache_jobs or self.cache_parsed:
+            rows = self._jobs_by_id().get(job_id)
+            # Hand out a copy: the DataManager exposes the frame it wraps,
+            # and edits to it must not reach later fetches of the job.
+            return None if rows is None else rows.copy()
 
-            parsed_rows.append(row)
+        df = read_csv_arrow(self.file_path, self.delimiter, job_id=job_id)
+        if df is None:
+            if pa_csv is not None:
+                logger.warning(
+                    "Could not stream '%s' with PyArrow; parsing the whole file "
+                    "for job '%s' (cache_jobs=True keeps that parse for later jobs).",
+                    self.file_path, job_id,
+                )
+            df = self._read_csv_robust()
+            df = _with_default_index(df[df["jobId"] == job_id])
+        return None if df.empty else df
 
-        if not parsed_rows:
-            raise IOError(f"No data rows found in CSV file: {self.file_path}")
-        df = pd.DataFrame(parsed_rows, columns=header)
+    def _jobs_by_id(self) -> Dict[str, pd.DataFrame]:
+        """
+        Return the parsed file split into one DataFrame per job ID.
+
+        The file is re-parsed only when its modification time has changed
+        since the previous call.
+        """
+        mtime_ns = self.file_path.stat().st_mtime_ns
+        key = (str(self.file_path), mtime_ns, self.delimiter)
+        if self._jobs_cache is None or self._jobs_cache[0] != key:
+            # Both parsers already yield jobId as text, so the rows are
+            # grouped on the column as-is instead of a str-cast copy of it.
+            df = self._read_parsed(mtime_ns)
+            jobs = {
+                job_id: _with_default_index(rows)
+                for job_id, rows in df.groupby("jobId", sort=False)
+            }
+            self._jobs_cache = (key, jobs)
+        return self._jobs_cache[1]
+
+    def _read_parsed(self, mtime_ns: int) -> pd.DataFrame:
+        """
+        Return the parsed file, going through the Feather mirror when
+        ``cache_parsed`` is enabled.
 
-        interval_cols = [col for col in df.columns if col.startswith("interval ")]
-        for column in interval_cols:
-            df[column] = pd.to_numeric(df[column], errors="coerce")
+        A mirror whose name does not carry the current modification time is
+        stale; it is removed when the fresh one is written.  Failing to read
+        or write the mirror is never fatal.
+        """
+        if not self.cache_parsed or pa is None:
+            return self._read_csv_robust()
+
+        cache_path = self.file_path.with_name(f"{self.file_path.name}.{mtime_ns}.feather")
+        if cache_path.exists():
+            try:
+                return pd.read_feather(cache_path)
+            except (OSError, pa.ArrowInvalid) as exc:
+                logger.warning("Ignoring unreadable CSV cache '%s': %s", cache_path, exc)
+
+        df = self._read_csv_robust()
+
+        # Write under a temporary name and rename, so concurrent readers
+        # never see a partially written mirror.
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            df.to_feather(tmp_path)
+            os.replace(tmp_path, cache_path)
+        except (OSError, ValueError, pa.ArrowException) as exc:
+            logger.warning("Could not write CSV cache '%s': %s", cache_path, exc)
+            tmp_path.unlink(missing_ok=True)
+            return df
 
+        for stale in self.file_path.parent.glob(f"{glob_escape(self.file_path.name)}.*.feather"):
+            if stale != cache_path:
+                stale.unlink(missing_ok=True)
         return df
-    
+
     def fetch_job_data(self, job_id: str) -> DataManager:
         """
         Fetch job metrics data from the CSV file for a given job ID.
@@ -115,13 +429,11 @@ class CSVDataSource(IDataSource):
             IOError: If the CSV cannot be read
         """
         try:
-            # Read the CSV file (robust against XBAT export format drifts)
-            df = self._read_csv_robust()
-            
-            # Filter by job ID
-            job_data = df[df['jobId'].astype(str) == str(job_id)]
+            # Read the CSV file (robust against XBAT export format drifts),
+            # or reuse the previous parse if the file is unchanged
+            job_data = self._job_rows(str(job_id))
             
-            if job_data.empty:
+            if job_data is None:
                 raise ValueError(f"Job ID '{job_id}' not found in {self.file_path}")
             
             # Compute intra-node imbalance from core-level traces if present.
@@ -132,7 +444,7 @@ class CSVDataSource(IDataSource):
                     ignore_index=True,
                 )
 
-            return DataManager(job_data.reset_index(drop=True))
+            return DataManager(job_data)
 
         except ValueError:
             raise
@@ -160,16 +472,13 @@ class CSVDataSource(IDataSource):
         if flops_df.empty:
             return None
 
+        block = np.nan_to_num(flops_df[interval_cols].to_numpy(dtype=float), nan=0.0)
         core_totals: Dict[str, np.ndarray] = {}
-        for _, row in flops_df.iterrows():
-            m = re.search(r"\bc(\d+)$", str(row["trace"]))
+        for trace, values in zip(flops_df["trace"], block):
+            m = re.search(r"\bc(\d+)$", str(trace))
             if not m:
                 continue
             core_id = m.group(0)
-            values = np.zeros(len(interval_cols))
-            for i, col in enumerate(interval_cols):
-                v = row.get(col, 0.0)
-                values[i] = float(v) if pd.notna(v) else 0.0
             if core_id not in core_totals:
                 core_totals[core_id] = values.copy()
             else:
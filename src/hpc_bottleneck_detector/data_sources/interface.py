@@ -5,7 +5,7 @@ This module defines the interface that all data sources must implement.
 """
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List
 
 if TYPE_CHECKING:
     from ..data.manager import DataManager
@@ -35,3 +35,15 @@ class IDataSource(ABC):
             IOError: If data cannot be retrieved
         """
         pass
+
+    def prepare_batch(self, job_ids: List[str]) -> None:
+        """
+        Prepare for fetching all of *job_ids*.
+
+        Called once before a batch is analysed, in the parent process when
+        the batch runs in parallel, so that state built here (e.g. a parsed
+        file) is shared by every worker.  No-op by default.
+
+        Args:
+            job_ids: Identifiers of the jobs about to be fetched.
+        """
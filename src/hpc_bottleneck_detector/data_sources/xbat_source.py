@@ -30,17 +30,29 @@ Credentials / environment variables:
 
 from __future__ import annotations
 
-import csv
+import functools
 import io
 import os
 import re
+import shlex
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote, urlencode
 
 import numpy as np
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to requests' stdlib decoder
+    orjson = None
+
+from .csv_source import pa, read_csv_arrow, read_csv_ragged
 from .interface import IDataSource
 from ..data.manager import DataManager
 from ..data.job_context import JobContext
@@ -55,6 +67,54 @@ _DEFAULT_PASSWORD = "demo"
 _DEFAULT_CLIENT_ID = "demo"
 _DEFAULT_TOKEN_FILE = ".env.xbat"
 
+# A token the server accepted is trusted for this many seconds before it is
+# checked against /current_user again.
+_TOKEN_VALIDATION_TTL = 300.0
+# Tokens with a known expiry are renewed this many seconds ahead of it.
+_TOKEN_EXPIRY_MARGIN = 60.0
+# The /api/v1/jobs listing is reused for this many seconds between lookups.
+_JOBS_LISTING_TTL = 30.0
+# Upper bound on the per-level CSV requests issued at once for load imbalance.
+_MAX_PARALLEL_FETCHES = 8
+
+# (api_base, token) -> time.monotonic() of the last successful validation,
+# shared by every XBATDataSource in the process.
+_validated_tokens: Dict[Tuple[str, str], float] = {}
+
+# Absolute token file path -> (st_mtime_ns, {KEY: value}) as last read or
+# written, so constructing further sources skips re-reading the file.
+_token_file_cache: Dict[Path, Tuple[int, Dict[str, str]]] = {}
+
+
+def _unquote(value: str) -> str:
+    """Undo the shell quoting :meth:`XBATDataSource._save_token` applies to a token file value."""
+    try:
+        return "".join(shlex.split(value))
+    except ValueError:  # unbalanced quotes: keep the raw text
+        return value
+
+
+def _new_session() -> requests.Session:
+    """Return a ``requests.Session`` with a connection pool sized for parallel fetches."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Session shared by every XBATDataSource that needs no per-instance proxy or
+# TLS settings, so connections to the XBAT host are kept alive across them.
+# Credentials are sent per request and never stored on it.
+_shared_session = _new_session()
+
+
+def _decode_json(resp: requests.Response):
+    """Decode a JSON response body, with ``orjson`` straight from the bytes when installed."""
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
+
 
 # ---------------------------------------------------------------------------
 # Load imbalance helper
@@ -99,7 +159,9 @@ class XBATDataSource(IDataSource):
         proxies:     Optional proxy mapping forwarded to the underlying
                      ``requests.Session``, e.g.
                      ``{'http': 'socks5h://localhost:xxx', 'https': 'socks5h://localhost:xxx'}``.
-        session:     Underlying ``requests.Session`` (created automatically).
+        session:     Underlying ``requests.Session``.  Defaults to a
+                     process-wide pooled session, or a dedicated one when
+                     *proxies* or ``verify_ssl=False`` are given.
     """
 
     def __init__(
@@ -115,6 +177,7 @@ class XBATDataSource(IDataSource):
         token_file: str = _DEFAULT_TOKEN_FILE,
         proxies: Optional[dict] = None,
         verify_ssl: bool = True,
+        session: Optional[requests.Session] = None,
     ) -> None:
         # Validate argument combinations
         if not group and metric:
@@ -134,8 +197,31 @@ class XBATDataSource(IDataSource):
         self.proxies = proxies or {}
         self.verify_ssl = verify_ssl
 
+        # Only the job ID varies between CSV requests of this instance.
+        self._url_prefix = f"{self.api_base}/api/v1/measurements/"
+        self._query_suffix = self._build_query_suffix()
+
         self._access_token: Optional[str] = None
-        self.session = requests.Session()
+        # Request headers carrying the token, rebuilt by _set_access_token
+        # rather than per request.  Kept off the session, which may be shared.
+        self._auth_headers: Dict[str, str] = {}
+        self._csv_headers: Dict[str, str] = {}
+        self._json_headers: Dict[str, str] = {}
+        # Wall-clock expiry of the token (from the OAuth ``expires_in``).
+        self._token_expires_at: Optional[float] = None
+        # (time.monotonic() of the fetch, {str(jobId): entry}) of the last jobs listing.
+        self._jobs_listing_cache: Optional[Tuple[float, Dict[str, dict]]] = None
+        # Raw node hardware by node hash; static, so kept for the instance's lifetime.
+        self._node_hw_cache: Dict[str, dict] = {}
+        # Serialises token refreshes triggered by concurrent requests.
+        self._token_lock = threading.Lock()
+        if session is not None:
+            self.session = session
+        elif self.proxies or not self.verify_ssl:
+            # Connection settings must not leak into the shared session.
+            self.session = _new_session()
+        else:
+            self.session = _shared_session
         if self.proxies:
             self.session.proxies.update(self.proxies)
         if not self.verify_ssl:
@@ -148,6 +234,25 @@ class XBATDataSource(IDataSource):
         if not self._validate_token():
             self._request_new_token()
 
+    # ------------------------------------------------------------------
+    # Pickling (e.g. into worker processes)
+    # ------------------------------------------------------------------
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        # Locks cannot be pickled, and the shared session belongs to the
+        # process: the copy is re-attached to the receiving process's one.
+        del state["_token_lock"]
+        if state["session"] is _shared_session:
+            state["session"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._token_lock = threading.Lock()
+        if self.session is None:
+            self.session = _shared_session
+
     # ------------------------------------------------------------------
     # Environment-based factory
     # ------------------------------------------------------------------
@@ -259,26 +364,45 @@ class XBATDataSource(IDataSource):
         """
         url = self._build_url(job_id)
 
-        response = self._get_authenticated(url)
-
-        if response.status_code == 404:
-            raise ValueError(
-                f"404 Not Found - request URL: {url}"
-            )
-        if response.status_code != 200:
-            raise IOError(
-                f"XBAT API returned HTTP {response.status_code}: {response.text[:200]}"
-            )
-
+        # The metadata requests do not depend on the CSV, so run them while it
+        # downloads: the latency is that of the slowest request, not the sum.
+        entry_future, interval_future, hardware_future = (
+            self._start_metadata_requests(job_id)
+        )
         try:
-            df = self._parse_xbat_csv_response(response.text)
-        except Exception as exc:
-            raise IOError(f"Failed to parse CSV response from XBAT: {exc}") from exc
-
-        # Fetch job entry once - reused for both context and node names.
-        job_entry = self._find_job_entry(job_id)
-        interval_seconds = self._fetch_interval(job_id)
-        job_context = self._build_job_context_from_entry(job_id, job_entry, interval_seconds)
+            response = self._get_authenticated(url)
+
+            if response.status_code == 404:
+                raise ValueError(
+                    f"404 Not Found - request URL: {url}"
+                )
+            if response.status_code != 200:
+                raise IOError(
+                    f"XBAT API returned HTTP {response.status_code}: {response.text[:200]}"
+                )
+
+            try:
+                df = self._parse_xbat_csv_response(response.content)
+            except Exception as exc:
+                raise IOError(f"Failed to parse CSV response from XBAT: {exc}") from exc
+
+            # Job entry is fetched once - reused for both context and node names.
+            job_entry = entry_future.result()
+        except BaseException:
+            for future in (entry_future, interval_future, hardware_future):
+                future.cancel()
+            raise
+
+        # The interval and hardware requests may still be in flight; they are
+        # collected only when the context is first read, so the imbalance
+        # requests below overlap them.
+        job_context_factory = (
+            None if job_entry is None
+            else functools.partial(
+                self._job_context_from_futures,
+                job_id, job_entry, interval_future, hardware_future,
+            )
+        )
 
         # Append computed load-imbalance rows (best-effort, never fatal).
         imbalance_rows = self._compute_load_imbalance_rows(job_id, df, job_entry)
@@ -288,7 +412,7 @@ class XBATDataSource(IDataSource):
                 ignore_index=True,
             )
 
-        return DataManager(df.reset_index(drop=True), job_context=job_context)
+        return DataManager(df, job_context_factory=job_context_factory)
 
     # ------------------------------------------------------------------
     # Load imbalance computation
@@ -311,11 +435,32 @@ class XBATDataSource(IDataSource):
         interval_cols = [c for c in main_df.columns if c.startswith("interval ")]
         rows: List[dict] = []
 
+        node_names: List[str] = []
+        if job_entry is not None:
+            node_names = list(job_entry.get("nodes", {}).keys())
+            if len(node_names) < 2:
+                node_names = []
+
+        # The core-level and per-node CSVs are independent; request them
+        # together over the session's pooled keep-alive connections.
+        with ThreadPoolExecutor(
+            max_workers=min(_MAX_PARALLEL_FETCHES, 1 + len(node_names)),
+            thread_name_prefix="xbat-imbalance",
+        ) as pool:
+            core_future = pool.submit(
+                self._fetch_csv_params, job_id, group="cpu", metric="FLOPS", level="core"
+            )
+            node_futures = {
+                name: pool.submit(
+                    self._fetch_csv_params, job_id, group="cpu", metric="FLOPS",
+                    level="node", node=name,
+                )
+                for name in node_names
+            }
+
         # --- Intra-node ------------------------------------------------------------------------
         try:
-            core_df = self._fetch_csv_params(
-                job_id, group="cpu", metric="FLOPS", level="core"
-            )
+            core_df = core_future.result()
             if core_df is not None:
                 row = self._intra_node_imbalance_row(job_id, core_df, interval_cols)
                 if row is not None:
@@ -324,28 +469,23 @@ class XBATDataSource(IDataSource):
             pass  # non-fatal
 
         # --- Inter-node ------------------------------------------------------------------------
-        if job_entry is not None:
-            node_names = list(job_entry.get("nodes", {}).keys())
-            if len(node_names) > 1:
-                try:
-                    node_totals: Dict[str, np.ndarray] = {}
-                    for name in node_names:
-                        node_df = self._fetch_csv_params(
-                            job_id, group="cpu", metric="FLOPS",
-                            level="node", node=name,
-                        )
-                        if node_df is not None:
-                            total = self._sum_flops_series(node_df, interval_cols)
-                            if total is not None:
-                                node_totals[name] = total
-                    if len(node_totals) > 1:
-                        row = self._inter_node_imbalance_row(
-                            job_id, node_totals, interval_cols
-                        )
-                        if row is not None:
-                            rows.append(row)
-                except Exception:
-                    pass  # non-fatal
+        if node_futures:
+            try:
+                node_totals: Dict[str, np.ndarray] = {}
+                for name, future in node_futures.items():
+                    node_df = future.result()
+                    if node_df is not None:
+                        total = self._sum_flops_series(node_df, interval_cols)
+                        if total is not None:
+                            node_totals[name] = total
+                if len(node_totals) > 1:
+                    row = self._inter_node_imbalance_row(
+                        job_id, node_totals, interval_cols
+                    )
+                    if row is not None:
+                        rows.append(row)
+            except Exception:
+                pass  # non-fatal
 
         return rows
 
@@ -368,13 +508,13 @@ class XBATDataSource(IDataSource):
         if flops_df.empty:
             return None
 
+        block = self._aligned_values(flops_df, interval_cols)
         core_totals: Dict[str, np.ndarray] = {}
-        for _, row in flops_df.iterrows():
-            m = re.search(r"\bc(\d+)$", str(row["trace"]))
+        for trace, values in zip(flops_df["trace"], block):
+            m = re.search(r"\bc(\d+)$", str(trace))
             if not m:
                 continue
             core_id = m.group(0)
-            values = self._aligned_values(row, interval_cols)
             if core_id not in core_totals:
                 core_totals[core_id] = values.copy()
             else:
@@ -414,23 +554,17 @@ class XBATDataSource(IDataSource):
         ]
         if flops_df.empty:
             return None
-        total = np.zeros(len(interval_cols))
-        for _, row in flops_df.iterrows():
-            total += self._aligned_values(row, interval_cols)
-        return total
+        return self._aligned_values(flops_df, interval_cols).sum(axis=0)
 
     @staticmethod
-    def _aligned_values(row: pd.Series, interval_cols: List[str]) -> np.ndarray:
+    def _aligned_values(df: pd.DataFrame, interval_cols: List[str]) -> np.ndarray:
         """
-        Extract numeric interval values from *row*, aligned to *interval_cols*.
-        Missing columns are filled with 0.
+        Extract numeric interval values from *df* as a ``(n_rows, n_intervals)``
+        array aligned to *interval_cols*.  Missing columns and NaN are filled
+        with 0.
         """
-        values = np.zeros(len(interval_cols))
-        for i, col in enumerate(interval_cols):
-            if col in row.index:
-                v = row[col]
-                values[i] = float(v) if pd.notna(v) else 0.0
-        return values
+        values = df.reindex(columns=interval_cols).to_numpy(dtype=float)
+        return np.nan_to_num(values, nan=0.0)
 
     @staticmethod
     def _build_imbalance_row(
@@ -467,14 +601,13 @@ class XBATDataSource(IDataSource):
         params: dict = {"group": group, "metric": metric, "level": level}
         if node:
             params["node"] = node
-        query = "&".join(f"{k}={v}" for k, v in params.items())
-        url = f"{base}?{query}"
+        url = f"{base}?{urlencode(params, quote_via=quote)}"
 
         response = self._get_authenticated(url)
         if response.status_code != 200:
             return None
         try:
-            return self._parse_xbat_csv_response(response.text)
+            return self._parse_xbat_csv_response(response.content)
         except Exception:
             return None
 
@@ -484,67 +617,54 @@ class XBATDataSource(IDataSource):
 
     def _get_authenticated(self, url: str) -> requests.Response:
         """GET *url* with the current bearer token, refreshing once on 401."""
-        headers = {
-            "accept": "text/csv",
-            "Authorization": f"Bearer {self._access_token}",
-        }
-        response = self.session.get(url, headers=headers)
+        token = self._access_token
+        response = self.session.get(url, headers=self._csv_headers)
         if response.status_code == 401:
-            self._request_new_token()
-            headers["Authorization"] = f"Bearer {self._access_token}"
-            response = self.session.get(url, headers=headers)
+            self._refresh_token(token)
+            response = self.session.get(url, headers=self._csv_headers)
         return response
 
-    def _get_authenticated_json(self, url: str, params: Optional[dict] = None) -> requests.Response:
-        headers = {
-            "accept": "application/json",
-            "Authorization": f"Bearer {self._access_token}",
-        }
-        response = self.session.get(url, headers=headers, params=params)
+    def _get_authenticated_json(
+        self,
+        url: str,
+        params: Optional[dict] = None,
+        timeout: Optional[float] = None,
+    ) -> requests.Response:
+        """JSON counterpart of :meth:`_get_authenticated`, refreshing once on 401."""
+        token = self._access_token
+        response = self.session.get(url, headers=self._json_headers, params=params, timeout=timeout)
         if response.status_code == 401:
-            self._request_new_token()
-            headers["Authorization"] = f"Bearer {self._access_token}"
-            response = self.session.get(url, headers=headers, params=params)
+            self._refresh_token(token)
+            response = self.session.get(
+                url, headers=self._json_headers, params=params, timeout=timeout
+            )
         return response
 
-    def _parse_xbat_csv_response(self, csv_text: str) -> pd.DataFrame:
+    def _parse_xbat_csv_response(self, payload: bytes) -> pd.DataFrame:
         """
         Parse XBAT CSV robustly across schema differences.
 
         Current production behavior can produce csv where a subset of metric
         rows contains one additional trailing interval value. Drop conservatively
         the trailing overflow values so every metric shares the same interval count.
-        """
-        rows = list(csv.reader(io.StringIO(csv_text)))
-        if not rows:
-            raise IOError("Empty CSV response from XBAT.")
-
-        header = rows[0]
-        expected_cols = len(header)
-        parsed_rows: list[list[str]] = []
-
-        for row in rows[1:]:
-            if not row:
-                continue
-
-            if row[0] == "jobId":
-                continue
 
-            if len(row) > expected_cols:
-                row = row[:expected_cols]
-            elif len(row) < expected_cols:
-                row = row + [""] * (expected_cols - len(row))
+        Well-formed responses are parsed straight from the raw response bytes
+        by the PyArrow reader when it is installed; responses it rejects
+        (e.g. ragged rows) fall back to
+        :func:`~hpc_bottleneck_detector.data_sources.csv_source.read_csv_ragged`.
+        """
+        if pa is not None:
+            df = read_csv_arrow(pa.py_buffer(payload))
+            if df is not None:
+                return df
 
-            parsed_rows.append(row)
+        try:
+            df = read_csv_ragged(io.BytesIO(payload))
+        except pd.errors.EmptyDataError:
+            raise IOError("Empty CSV response from XBAT.")
 
-        if not parsed_rows:
+        if df.empty:
             raise IOError("No data rows found in XBAT CSV response.")
-        df = pd.DataFrame(parsed_rows, columns=header)
-
-        interval_cols = [col for col in df.columns if col.startswith("interval ")]
-        for column in interval_cols:
-            df[column] = pd.to_numeric(df[column], errors="coerce")
-
         return df
 
     # ------------------------------------------------------------------
@@ -552,19 +672,84 @@ class XBATDataSource(IDataSource):
     # ------------------------------------------------------------------
 
     def _fetch_job_context(self, job_id: str) -> Optional[JobContext]:
-        """Build a JobContext by fetching the job entry from XBAT."""
-        return self._build_job_context_from_entry(job_id, self._find_job_entry(job_id))
+        """Build a JobContext by fetching the job metadata from XBAT."""
+        entry_future, interval_future, hardware_future = (
+            self._start_metadata_requests(job_id)
+        )
+        job_entry = entry_future.result()
+        if job_entry is None:
+            return None
+        return self._job_context_from_futures(
+            job_id, job_entry, interval_future, hardware_future
+        )
+
+    def _start_metadata_requests(self, job_id: str) -> Tuple[Future, Future, Future]:
+        """
+        Start the requests a JobContext for *job_id* is built from.
+
+        Returns the futures of the job entry, the sampling interval and the
+        node hardware.  The first two run concurrently; the node hardware
+        request follows as soon as the entry names the node hashes.
+        """
+        pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix="xbat-metadata")
+        entry_future = pool.submit(self._find_job_entry, job_id)
+        interval_future = pool.submit(self._fetch_interval, job_id)
+        hardware_future = pool.submit(self._fetch_entry_hardware, entry_future)
+        # No further tasks: the threads exit once these three are done.
+        pool.shutdown(wait=False)
+        return entry_future, interval_future, hardware_future
+
+    def _fetch_entry_hardware(self, entry_future: Future) -> Optional[dict]:
+        """
+        Wait for the job entry of *entry_future*, then fetch its node hardware.
+
+        Returns ``None`` when there is no entry, it names no node hashes, or
+        a request fails (best-effort, never fatal).
+        """
+        try:
+            job_entry = entry_future.result()
+            if job_entry is None:
+                return None
+            node_hashes = self._node_hashes(job_entry)
+            return self._fetch_node_hardware(node_hashes) if node_hashes else None
+        except Exception:  # pragma: no cover - best-effort, never fatal
+            return None
+
+    def _job_context_from_futures(
+        self,
+        job_id: str,
+        job_entry: dict,
+        interval_future: Future,
+        hardware_future: Future,
+    ) -> Optional[JobContext]:
+        """Build the JobContext from the metadata requests started by :meth:`fetch_job_data`."""
+        return self._build_job_context_from_entry(
+            job_id, job_entry, interval_future.result(), hardware_future.result()
+        )
+
+    @staticmethod
+    def _node_hashes(job_entry: dict) -> Tuple[str, ...]:
+        """Return the distinct hardware hashes of the nodes in *job_entry*, sorted."""
+        return tuple(sorted({
+            node_hash
+            for meta in job_entry.get("nodes", {}).values()
+            if (node_hash := meta.get("hash"))
+        }))
 
     def _build_job_context_from_entry(
         self,
         job_id: str,
         job_entry: Optional[dict],
         interval_seconds: Optional[float] = None,
+        node_hardware_raw: Optional[dict] = None,
     ) -> Optional[JobContext]:
         """
         Build a :class:`~hpc_bottleneck_detector.data.job_context.JobContext`
         from a pre-fetched job entry dict.
 
+        The node hardware is fetched here unless *node_hardware_raw* was
+        already retrieved alongside the entry.
+
         Returns:
             :class:`JobContext` on success, ``None`` if *job_entry* is ``None``
             or the metadata endpoints are unavailable.
@@ -573,15 +758,11 @@ class XBATDataSource(IDataSource):
             if job_entry is None:
                 return None
 
-            node_hashes = list({
-                meta.get("hash")
-                for meta in job_entry.get("nodes", {}).values()
-                if meta.get("hash")
-            })
-            if not node_hashes:
-                return None
-
-            node_hardware_raw = self._fetch_node_hardware(node_hashes)
+            if node_hardware_raw is None:
+                node_hashes = self._node_hashes(job_entry)
+                if not node_hashes:
+                    return None
+                node_hardware_raw = self._fetch_node_hardware(node_hashes)
             return JobContext.from_xbat(job_id, job_entry, node_hardware_raw, interval_seconds)
 
         except Exception:  # pragma: no cover - best-effort, never fatal
@@ -598,7 +779,7 @@ class XBATDataSource(IDataSource):
             })
             if resp.status_code != 200:
                 return None
-            traces = resp.json().get("traces", [])
+            traces = _decode_json(resp).get("traces", [])
             if traces:
                 return float(traces[0]["interval"])
         except Exception:
@@ -611,77 +792,188 @@ class XBATDataSource(IDataSource):
 
         Returns ``None`` if the job is not present in the listing.
         """
-        resp = self.session.get(
+        jobs_by_id = self._jobs_by_id()
+        if jobs_by_id is None:
+            return None
+        return jobs_by_id.get(str(job_id))
+
+    def _jobs_by_id(self) -> Optional[Dict[str, dict]]:
+        """
+        Return the entries of ``GET /api/v1/jobs?short=true`` keyed by ``str(jobId)``.
+
+        The listing is fetched at most once every ``_JOBS_LISTING_TTL``
+        seconds, so analysing several jobs in a row costs one request rather
+        than one per job.  Returns ``None`` on a non-200 response (which is
+        not cached).
+        """
+        now = time.monotonic()
+        cached = self._jobs_listing_cache
+        if cached is not None and now - cached[0] < _JOBS_LISTING_TTL:
+            return cached[1]
+
+        # Refreshes the token on 401: this lookup runs concurrently with the
+        # CSV download and must not lose a race against its token refresh.
+        resp = self._get_authenticated_json(
             f"{self.api_base}/api/v1/jobs",
             params={"short": "true"},
-            headers={"Authorization": f"Bearer {self._access_token}"},
             timeout=30,
         )
         if resp.status_code != 200:
             return None
 
-        jobs: list = resp.json().get("data", [])
-        for entry in jobs:
-            if str(entry.get("jobId")) == str(job_id):
-                return entry
-        return None
+        jobs_by_id: Dict[str, dict] = {}
+        for entry in _decode_json(resp).get("data", []):
+            # Keep the first entry of a duplicated jobId, as a linear scan would.
+            jobs_by_id.setdefault(str(entry.get("jobId")), entry)
+        self._jobs_listing_cache = (now, jobs_by_id)
+        return jobs_by_id
 
-    def _fetch_node_hardware(self, node_hashes: list) -> dict:
+    def _fetch_node_hardware(self, node_hashes: Tuple[str, ...]) -> dict:
         """
-        Call ``GET /api/v1/nodes?node_hashes=<h1>,<h2>, ...`` and return the
-        raw response dict (keyed by hash).
+        Return the raw hardware dicts of *node_hashes*, keyed by hash.
+
+        Node hardware is static, so only hashes not seen before by this
+        instance are requested from ``GET /api/v1/nodes?node_hashes=<h1>,<h2>, ...``.
+        On a non-200 response only the already cached hashes are returned.
         """
-        hashes_param = ",".join(node_hashes)
-        resp = self.session.get(
-            f"{self.api_base}/api/v1/nodes",
-            params={"node_hashes": hashes_param},
-            headers={"Authorization": f"Bearer {self._access_token}"},
-            timeout=30,
-        )
-        if resp.status_code != 200:
-            return {}
-        return resp.json()
+        missing = [h for h in node_hashes if h not in self._node_hw_cache]
+        if missing:
+            resp = self._get_authenticated_json(
+                f"{self.api_base}/api/v1/nodes",
+                params={"node_hashes": ",".join(missing)},
+                timeout=30,
+            )
+            if resp.status_code == 200:
+                self._node_hw_cache.update(_decode_json(resp))
+        return {h: self._node_hw_cache[h] for h in node_hashes if h in self._node_hw_cache}
 
     # ------------------------------------------------------------------
     # Token management
     # ------------------------------------------------------------------
 
+    def _set_access_token(self, token: str) -> None:
+        """Store *token* and rebuild the request headers that carry it."""
+        self._access_token = token
+        auth = {"Authorization": f"Bearer {token}"}
+        self._auth_headers = auth
+        self._csv_headers = {"accept": "text/csv", **auth}
+        self._json_headers = {"accept": "application/json", **auth}
+
     def _load_token(self) -> None:
-        """Load a previously cached access token from *token_file*, if present."""
-        if not self.token_file.exists():
+        """
+        Load a previously cached access token (and its expiry) from *token_file*, if present.
+
+        The stored expiry is only used when the file also records this
+        instance's ``api_base`` and ``username``; a token issued for another
+        server or account is otherwise trusted as if it had no known expiry,
+        so :meth:`_validate_token` checks it with the server.
+
+        The file is only read again when its modification time has changed
+        since this process last read or wrote it.
+        """
+        try:
+            mtime_ns = self.token_file.stat().st_mtime_ns
+        except FileNotFoundError:
             return
-        with self.token_file.open() as fh:
-            for line in fh:
+
+        path = self.token_file.absolute()
+        cached = _token_file_cache.get(path)
+        if cached is None or cached[0] != mtime_ns:
+            fields: Dict[str, str] = {}
+            for line in self.token_file.read_text().splitlines():
                 key, _, value = line.strip().partition("=")
-                if key == "ACCESS_TOKEN":
-                    self._access_token = value
-                    break
+                # The first line of a key wins, e.g. for ACCESS_TOKEN.
+                fields.setdefault(key, _unquote(value))
+            cached = (mtime_ns, fields)
+            _token_file_cache[path] = cached
+
+        fields = cached[1]
+        token = fields.get("ACCESS_TOKEN")
+        if token is not None:
+            self._set_access_token(token)
+
+        self._token_expires_at = None
+        issued_here = (
+            fields.get("TOKEN_API_BASE") == self.api_base
+            and fields.get("TOKEN_USERNAME") == self.username
+        )
+        if issued_here:
+            try:
+                self._token_expires_at = float(fields["EXPIRES_AT"])
+            except (KeyError, ValueError):
+                pass
 
     def _save_token(self) -> None:
-        """Persist the current access token to *token_file*."""
+        """
+        Persist the current access token (and its expiry, if known) to *token_file*,
+        along with the server and account it was issued for.
+        """
+        fields = {
+            "ACCESS_TOKEN": self._access_token,
+            "TOKEN_API_BASE": self.api_base,
+            "TOKEN_USERNAME": self.username,
+        }
+        if self._token_expires_at is not None:
+            fields["EXPIRES_AT"] = str(self._token_expires_at)
+        # scripts/misc/*.sh ``source`` this file: quote every value so that
+        # e.g. a username with spaces or shell metacharacters stays a string.
         with self.token_file.open("w") as fh:
-            fh.write(f"ACCESS_TOKEN={self._access_token}\n")
+            for key, value in fields.items():
+                fh.write(f"{key}={shlex.quote(value)}\n")
         # Restrict file permissions so the token is not world-readable
         self.token_file.chmod(0o600)
+        _token_file_cache[self.token_file.absolute()] = (
+            self.token_file.stat().st_mtime_ns,
+            fields,
+        )
 
     def _validate_token(self) -> bool:
         """
         Return ``True`` if the current token is accepted by the server.
 
         A missing token is immediately treated as invalid without a network
-        round-trip.
+        round-trip.  So is a token whose known expiry is less than
+        ``_TOKEN_EXPIRY_MARGIN`` seconds away, while one further from it is
+        accepted outright (the expiry is only known for tokens issued to
+        this server and account, see :meth:`_load_token`).  Without a known expiry, a successful check is
+        trusted for ``_TOKEN_VALIDATION_TTL`` seconds by every instance in
+        the process.
         """
         if not self._access_token:
             return False
+
+        if self._token_expires_at is not None:
+            return time.time() < self._token_expires_at - _TOKEN_EXPIRY_MARGIN
+
+        key = (self.api_base, self._access_token)
+        validated_at = _validated_tokens.get(key)
+        if validated_at is not None and time.monotonic() - validated_at < _TOKEN_VALIDATION_TTL:
+            return True
+
         try:
             resp = self.session.get(
                 f"{self.api_base}/api/v1/current_user",
-                headers={"Authorization": f"Bearer {self._access_token}"},
+                headers=self._auth_headers,
                 timeout=10,
             )
-            return resp.status_code == 200
         except requests.RequestException:
             return False
+        if resp.status_code != 200:
+            _validated_tokens.pop(key, None)
+            return False
+        _validated_tokens[key] = time.monotonic()
+        return True
+
+    def _refresh_token(self, stale_token: Optional[str]) -> None:
+        """
+        Replace *stale_token* after the server rejected it.
+
+        Concurrent requests that were rejected with the same token trigger a
+        single refresh; the others reuse the token it obtained.
+        """
+        with self._token_lock:
+            if self._access_token == stale_token:
+                self._request_new_token()
 
     def _request_new_token(self) -> None:
         """
@@ -700,14 +992,19 @@ class XBATDataSource(IDataSource):
             },
             timeout=10,
         )
-        payload = resp.json()
+        payload = _decode_json(resp)
         token = payload.get("access_token")
         if not token:
             raise IOError(
                 f"Failed to obtain XBAT access token. "
                 f"Server response: {payload}"
             )
-        self._access_token = token
+        self._set_access_token(token)
+        expires_in = payload.get("expires_in")
+        self._token_expires_at = (
+            time.time() + float(expires_in) if expires_in is not None else None
+        )
+        _validated_tokens[(self.api_base, token)] = time.monotonic()
         self._save_token()
 
     # ------------------------------------------------------------------
@@ -716,7 +1013,13 @@ class XBATDataSource(IDataSource):
 
     def _build_url(self, job_id: str) -> str:
         """Construct the full CSV endpoint URL including query parameters."""
-        base = f"{self.api_base}/api/v1/measurements/{job_id}/csv"
+        return f"{self._url_prefix}{job_id}/csv{self._query_suffix}"
+
+    def _build_query_suffix(self) -> str:
+        """
+        Return the ``?group=...`` query string shared by every CSV request of
+        this instance (empty when no parameter is set).
+        """
         params: dict[str, str] = {}
 
         if self.group:
@@ -729,7 +1032,5 @@ class XBATDataSource(IDataSource):
             params["node"] = self.node
 
         if not params:
-            return base
-
-        query = "&".join(f"{k}={v}" for k, v in params.items())
-        return f"{base}?{query}"
+            return ""
+        return "?" + urlencode(params, quote_via=quote)
@@ -19,11 +19,14 @@ keys are ``pipeline``, ``data_source``, ``strategy`` and ``output``.
 from __future__ import annotations
 
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 
 import yaml
 
+from .data.aggregation import warm_up as warm_up_kernels
 from .data.manager import DataManager
 from .data.hardware_profiles import HardwareProfileLoader
 from .data_sources.interface import IDataSource
@@ -163,6 +166,83 @@ class AnalysisOrchestrator:
             List of :class:`~hpc_bottleneck_detector.output.models.WindowDiagnosis`
             objects (after filtering).
         """
+        window_diagnoses = self.analyze_job(job_id)
+
+        # --- 5. Format / save ---------------------------------------------------------------
+        fmt       = self.output_cfg.get("format", "print")
+        save_path = self.output_cfg.get("save_path")
+        format_results(window_diagnoses, fmt=fmt, save_path=save_path)
+
+        return window_diagnoses
+
+    def run_all(
+        self,
+        job_ids: Iterable[str],
+        max_workers: Optional[int] = 1,
+    ) -> Dict[str, List[WindowDiagnosis]]:
+        """
+        Analyse several jobs with the same data source and strategy.
+
+        The data source is prepared for the batch and compiled kernels are
+        warmed up once before the loop.  When running in parallel, this
+        orchestrator (with its data source and strategy, which must be
+        picklable) is handed to every worker process once, at start-up, so
+        per-source caches persist across the jobs of a worker.  Unlike
+        :meth:`run_pipeline`, nothing is rendered or saved; pass the returned
+        lists to :func:`~hpc_bottleneck_detector.output.formatter.format_results`
+        as needed.  Jobs that fail are logged and skipped.
+
+        Args:
+            job_ids:     Identifiers of the jobs to analyse.
+            max_workers: Number of worker processes.  ``1`` (default) analyses
+                         the jobs sequentially in this process; ``None`` uses
+                         one worker per CPU.
+
+        Returns:
+            Dict mapping each successfully analysed job ID to its filtered
+            :class:`~hpc_bottleneck_detector.output.models.WindowDiagnosis`
+            list, in the order of *job_ids*.
+        """
+        job_ids = list(job_ids)
+        workers = (os.cpu_count() or 1) if max_workers is None else max_workers
+        workers = min(workers, len(job_ids))
+
+        results: Dict[str, List[WindowDiagnosis]] = {}
+        # In the parent, so that parallel workers inherit what it builds.
+        self.data_source.prepare_batch(job_ids)
+        if workers <= 1:
+            warm_up_kernels()
+            for job_id in job_ids:
+                try:
+                    results[job_id] = self.analyze_job(job_id)
+                except (ValueError, IOError) as exc:
+                    logger.error("Skipping job '%s': %s", job_id, exc)
+                except Exception:
+                    logger.exception("Skipping job '%s' after an unexpected error.", job_id)
+            return results
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self,),
+        ) as pool:
+            futures = {job_id: pool.submit(_analyze_in_worker, job_id) for job_id in job_ids}
+            for job_id, future in futures.items():
+                try:
+                    results[job_id] = future.result()
+                except (ValueError, IOError) as exc:
+                    logger.error("Skipping job '%s': %s", job_id, exc)
+                except Exception:
+                    # Includes a broken pool, e.g. an orchestrator that
+                    # cannot be pickled into the workers.
+                    logger.exception("Skipping job '%s' after an unexpected error.", job_id)
+        return results
+
+    def analyze_job(self, job_id: str) -> List[WindowDiagnosis]:
+        """
+        Run pipeline steps 1-4 for *job_id* (fetch, window, diagnose, filter)
+        without rendering or saving the results.
+        """
         logger.info("Starting pipeline for job '%s'.", job_id)
 
         # --- 1. Fetch data -------------------------------------------------------------------
@@ -197,14 +277,7 @@ class AnalysisOrchestrator:
         )
 
         # --- 4. Filter -------------------------------------------------------------------------
-        window_diagnoses = self._apply_filters(window_diagnoses)
-
-        # --- 5. Format / save ---------------------------------------------------------------
-        fmt       = self.output_cfg.get("format", "print")
-        save_path = self.output_cfg.get("save_path")
-        format_results(window_diagnoses, fmt=fmt, save_path=save_path)
-
-        return window_diagnoses
+        return self._apply_filters(window_diagnoses)
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -280,6 +353,8 @@ class AnalysisOrchestrator:
             return CSVDataSource(
                 file_path=cfg["file_path"],
                 delimiter=cfg.get("delimiter", ","),
+                cache_parsed=bool(cfg.get("cache_parsed", False)),
+                cache_jobs=bool(cfg.get("cache_jobs", True)),
             )
 
         if ds_type == "xbat":
@@ -363,3 +438,23 @@ class AnalysisOrchestrator:
             f"Unsupported strategy type: '{strat_type}'. "
             "Expected 'heuristic' or 'supervised_ml'."
         )
+
+
+# ---------------------------------------------------------------------------
+# Process-pool workers (see AnalysisOrchestrator.run_all)
+# ---------------------------------------------------------------------------
+
+# Orchestrator of the current worker process, set once by _init_worker.
+_worker_orchestrator: Optional[AnalysisOrchestrator] = None
+
+
+def _init_worker(orchestrator: AnalysisOrchestrator) -> None:
+    """Keep *orchestrator* for the tasks of this worker and warm up the kernels."""
+    global _worker_orchestrator
+    _worker_orchestrator = orchestrator
+    warm_up_kernels()
+
+
+def _analyze_in_worker(job_id: str) -> List[WindowDiagnosis]:
+    """Task body: analyse *job_id* with the worker's orchestrator."""
+    return _worker_orchestrator.analyze_job(job_id)
@@ -9,10 +9,11 @@ from __future__ import annotations
 
 import csv
 import io
+import itertools
 import json
 import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from .models import WindowDiagnosis
 
@@ -60,43 +61,46 @@ def format_results(
 # ---------------------------------------------------------------------------
 
 def _to_print(windows: List[WindowDiagnosis]) -> str:
-    lines: List[str] = []
-
-    lines.append("=" * 70)
-    lines.append(f"  HPC BOTTLENECK DETECTOR - {len(windows)} window(s)")
-    lines.append("=" * 70)
-
-    for wd in windows:
-        if wd.has_bottlenecks():
-            status = "BOTTLENECK"
-        elif wd.has_unknowns():
-            status = "UNKNOWN"
-        else:
-            status = "HEALTHY"
-        lines.append(
-            f"\n[Window {wd.window_index:>3}]  "
-            f"intervals {wd.start_interval}-{wd.end_interval}  "
-            f"({status})"
+    header = (
+        "=" * 70,
+        f"  HPC BOTTLENECK DETECTOR - {len(windows)} window(s)",
+        "=" * 70,
+    )
+    footer = ("\n" + "=" * 70 + "\n",)
+    body = itertools.chain.from_iterable(_window_lines(wd) for wd in windows)
+    return "\n".join(itertools.chain(header, body, footer))
+
+
+def _window_lines(wd: WindowDiagnosis) -> Iterator[str]:
+    """Yield the console lines for a single window."""
+    if wd.has_bottlenecks():
+        status = "BOTTLENECK"
+    elif wd.has_unknowns():
+        status = "UNKNOWN"
+    else:
+        status = "HEALTHY"
+    yield (
+        f"\n[Window {wd.window_index:>3}]  "
+        f"intervals {wd.start_interval}-{wd.end_interval}  "
+        f"({status})"
+    )
+    if not wd.diagnoses:
+        yield "  (no diagnoses)"
+        return
+
+    for diag in wd.diagnoses:
+        bt = diag.bottleneck_type.value
+        src = f"[{diag.source}]" if diag.source else ""
+        yield (
+            f"  - {bt:<35} severity={diag.severity_score:.2f}  "
+            f"confidence={diag.confidence:.2f}  {src}"
         )
-        if not wd.diagnoses:
-            lines.append("  (no diagnoses)")
-            continue
-
-        for diag in wd.diagnoses:
-            bt = diag.bottleneck_type.value
-            sev = f"{diag.severity_score:.2f}"
-            conf = f"{diag.confidence:.2f}"
-            src = f"[{diag.source}]" if diag.source else ""
-            lines.append(f"  - {bt:<35} severity={sev}  confidence={conf}  {src}")
-            if diag.recommendation:
-                # indent multi-line recommendations
-                rec_lines = diag.recommendation.strip().splitlines()
-                lines.append(f"    Recommendation: {rec_lines[0]}")
-                for rl in rec_lines[1:]:
-                    lines.append(f"    {rl}")
-
-    lines.append("\n" + "=" * 70 + "\n")
-    return "\n".join(lines)
+        if diag.recommendation:
+            # indent multi-line recommendations
+            rec_lines = diag.recommendation.strip().splitlines()
+            yield f"    Recommendation: {rec_lines[0]}"
+            for rl in rec_lines[1:]:
+                yield f"    {rl}"
 
 
 def _to_json(windows: List[WindowDiagnosis]) -> str:
@@ -115,12 +119,15 @@ def _to_csv(windows: List[WindowDiagnosis]) -> str:
     writer.writeheader()
 
     for wd in windows:
+        window_fields = {
+            "window_index": wd.window_index,
+            "start_interval": wd.start_interval,
+            "end_interval": wd.end_interval,
+            "has_bottlenecks": wd.has_bottlenecks(),
+        }
         if not wd.diagnoses:
             writer.writerow({
-                "window_index": wd.window_index,
-                "start_interval": wd.start_interval,
-                "end_interval": wd.end_interval,
-                "has_bottlenecks": wd.has_bottlenecks(),
+                **window_fields,
                 "bottleneck_type": "",
                 "severity_score": "",
                 "confidence": "",
@@ -130,10 +137,7 @@ def _to_csv(windows: List[WindowDiagnosis]) -> str:
         else:
             for diag in wd.diagnoses:
                 writer.writerow({
-                    "window_index": wd.window_index,
-                    "start_interval": wd.start_interval,
-                    "end_interval": wd.end_interval,
-                    "has_bottlenecks": wd.has_bottlenecks(),
+                    **window_fields,
                     "bottleneck_type": diag.bottleneck_type.value,
                     "severity_score": round(diag.severity_score, 4),
                     "confidence": round(diag.confidence, 4),
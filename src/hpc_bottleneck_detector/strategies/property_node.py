@@ -15,74 +15,100 @@ The recursive tree is built directly from the YAML representation by
 from __future__ import annotations
 
 import logging
+import operator as _operator
 from typing import Any, Dict, List, Optional, TYPE_CHECKING
 
 import numpy as np
-import pandas as pd
 
 if TYPE_CHECKING:
     from ..data.manager import DataManager
 
+from ..data.aggregation import aggregate
 from ..output.models import BottleneckType, Diagnosis
 
 logger = logging.getLogger(__name__)
 
+# Comparison operators accepted in the ``operator`` field of decision nodes.
+_OPERATORS = {
+    ">":  _operator.gt,
+    "<":  _operator.lt,
+    ">=": _operator.ge,
+    "<=": _operator.le,
+    "==": _operator.eq,
+    "!=": _operator.ne,
+}
+
 
 # ---------------------------------------------------------------------------
 # Module-level helpers
 # ---------------------------------------------------------------------------
 
-def _get_series(metric_cfg: dict, data_mgr: "DataManager") -> pd.Series:
+def _get_values(metric_cfg: dict, data_mgr: "DataManager") -> np.ndarray:
     """
-    Resolve a metric configuration to a pandas Series of interval values.
+    Resolve a metric configuration to an array of interval values.
 
     Handles three cases:
 
     * **simple** ``{group, metric, trace}`` - direct DataManager lookup.
-    * **sum** ``{type: sum, operands: [...]}`` - element-wise sum of operands.
+    * **sum** ``{type: sum, operands: [...]}`` - element-wise sum of operands;
+      NaN operands are skipped (the result is NaN only where every operand is).
     * **ratio** ``{type: ratio, numerator: ..., denominator: ...}`` -
       element-wise division; zeros in denominator become NaN.
 
+    The returned array may be a read-only view into the DataManager cache
+    and must not be modified in place.
+
     Raises:
         ValueError: If a required simple metric is absent from *data_mgr*.
     """
     kind = metric_cfg.get("type")
 
     if kind == "sum":
-        series_list = [_get_series(op, data_mgr) for op in metric_cfg["operands"]]
-        result = series_list[0].copy().astype(float)
-        for s in series_list[1:]:
-            result = result.add(s.astype(float), fill_value=0.0)
+        stacked = np.vstack([_get_values(op, data_mgr) for op in metric_cfg["operands"]])
+        missing = np.isnan(stacked)
+        result = np.where(missing, 0.0, stacked).sum(axis=0)
+        result[missing.all(axis=0)] = np.nan
         return result
 
     if kind == "ratio":
-        num = _get_series(metric_cfg["numerator"], data_mgr).astype(float)
-        den = _get_series(metric_cfg["denominator"], data_mgr).astype(float)
-        den_safe = den.replace(0.0, float("nan"))
+        num = _get_values(metric_cfg["numerator"], data_mgr)
+        den = _get_values(metric_cfg["denominator"], data_mgr)
+        den_safe = np.where(den == 0.0, np.nan, den)
         return num / den_safe
 
     # Simple metric
-    return data_mgr.get_metric(
+    return data_mgr.get_metric_array(
         group=metric_cfg["group"],
         metric=metric_cfg["metric"],
         trace=metric_cfg.get("trace"),
-    ).astype(float)
+    )
+
 
+def _aggregate(values: np.ndarray, aggregation: str) -> float:
+    """
+    Reduce an array to a scalar using the named aggregation.
+
+    NaN entries are ignored; an all-NaN (or empty) input yields NaN for every
+    aggregation except ``sum``/``total``, which yields ``0.0``.
+    """
+    return float(aggregate(values, aggregation))
 
-def _aggregate(series: pd.Series, aggregation: str) -> float:
-    """Reduce a Series to a scalar using the named aggregation."""
-    agg = aggregation.lower()
-    if agg == "mean":
-        return float(series.mean())
-    if agg == "min":
-        return float(series.min())
-    if agg == "max":
-        return float(series.max())
-    if agg in ("sum", "total"):
-        return float(series.sum())
-    if agg == "median":
-        return float(series.median())
-    raise ValueError(f"Unknown aggregation: '{aggregation}'")
+
+def _get_aggregate(metric_cfg: dict, aggregation: str, data_mgr: "DataManager") -> float:
+    """
+    Resolve a metric configuration straight to its aggregated scalar.
+
+    Simple metrics are served from the DataManager's batched per-window
+    reductions; derived (sum / ratio) metrics are built and reduced here.
+    """
+    if metric_cfg.get("type") is None:
+        return data_mgr.get_metric_aggregate(
+            group=metric_cfg["group"],
+            metric=metric_cfg["metric"],
+            trace=metric_cfg.get("trace"),
+            aggregation=aggregation,
+        )
+    return _aggregate(_get_values(metric_cfg, data_mgr), aggregation)
 
 
 def _resolve_threshold(threshold_cfg: Any, data_mgr: "DataManager") -> float:
@@ -125,17 +151,10 @@ def _resolve_threshold(threshold_cfg: Any, data_mgr: "DataManager") -> float:
 
 def _compare(value: float, operator: str, threshold: float) -> bool:
     """Apply a comparison operator."""
-    ops = {
-        ">":  value >  threshold,
-        "<":  value <  threshold,
-        ">=": value >= threshold,
-        "<=": value <= threshold,
-        "==": value == threshold,
-        "!=": value != threshold,
-    }
-    if operator not in ops:
+    op = _OPERATORS.get(operator)
+    if op is None:
         raise ValueError(f"Unknown operator: '{operator}'")
-    return ops[operator]
+    return bool(op(value, threshold))
 
 
 def _compute_severity(
@@ -247,8 +266,7 @@ class PropertyNode:
         Raises:
             ValueError: If a required metric is missing.
         """
-        series    = _get_series(self._metric_cfg, data_mgr)
-        value     = _aggregate(series, self._aggregation)
+        value     = _get_aggregate(self._metric_cfg, self._aggregation, data_mgr)
         threshold = _resolve_threshold(self._threshold_cfg, data_mgr)
         branch    = _compare(value, self._operator, threshold)
 